@@ -5,13 +5,13 @@
 
 from __future__ import annotations
 
+import contextlib
 import dataclasses
 import enum
+import functools as ft
 import inspect
 import typing as t
 
-import docstring_parser
-
 import feud.exceptions
 from feud import click
 from feud._internal import _decorators, _docstring, _inflect, _meta, _types
@@ -20,21 +20,34 @@ from feud.typing import custom
 
 CONTEXT_PARAM = "ctx"
 
+# common type hints that do not correspond to boolean flags
+# (a tuple, as membership is then checked without hashing the hint)
+NON_FLAG_TYPES: tuple[type, ...] = (str, int, float, bytes, type(None))
+
+POSITIONAL_KINDS = frozenset(
+    {
+        inspect.Parameter.POSITIONAL_ONLY,
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    }
+)
+
 
 class ParameterType(enum.Enum):
     OPTION = enum.auto()
     ARGUMENT = enum.auto()
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ParameterSpec:
     type: ParameterType | None = None
     hint: type | None = None  # type: ignore[valid-type]
     args: t.Sequence[str] = dataclasses.field(default_factory=list)
     kwargs: dict[str, t.Any] = dataclasses.field(default_factory=dict)
+    # whether the value should be hidden from validation errors
+    sensitive: bool = False
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CommandState:
     config: Config
     click_kwargs: dict[str, t.Any]
@@ -42,66 +55,46 @@ class CommandState:
     meta: _meta.FeudMeta
     overrides: dict[str, click.Parameter]  # key: parameter name
     pass_context: bool = False
-    # below keys are parameter name
-    arguments: dict[str, ParameterSpec] = dataclasses.field(
+    # parameter names after any @feud.rename (key: parameter name)
+    names: dict[str, str] = dataclasses.field(default_factory=dict)
+    # parameters to convert into click parameters, in signature order
+    # (key: parameter name, value: override or parameter specification)
+    parameters: dict[str, click.Parameter | ParameterSpec] = dataclasses.field(
         default_factory=dict
     )
-    options: dict[str, ParameterSpec] = dataclasses.field(default_factory=dict)
-    description: str | None = None
+    # names of positional arguments
+    positional: list[str] = dataclasses.field(default_factory=list)
+    # name of variable positional arguments (i.e. *args)
+    var_positional: str | None = None
+    doc: _docstring.ParsedDocstring | None = None
 
-    def decorate(  # noqa: PLR0915
-        self,
-        func: t.Callable,
-    ) -> click.Command | click.Group:
+    def decorate(self, func: t.Callable) -> click.Command | click.Group:
         meta_vars: dict[str, str] = {}
         sensitive_vars: dict[str, bool] = {}
-        positional: list[str] = []
-        var_positional: str | None = None
         params: list[click.Parameter] = []
 
-        sig: inspect.Signature = inspect.signature(func, eval_str=True)
-
-        for i, (param_name, param_spec) in enumerate(sig.parameters.items()):
-            # store names of positional arguments
-            if param_spec.kind in (
-                param_spec.POSITIONAL_ONLY,
-                param_spec.POSITIONAL_OR_KEYWORD,
-            ):
-                positional.append(param_name)
-            # store name of variable positional arguments (i.e. *args)
-            if param_spec.kind == param_spec.VAR_POSITIONAL:
-                var_positional = param_name
-            # ignore variable keyword arguments (i.e. **kwargs)
-            if param_spec.kind == param_spec.VAR_KEYWORD:
-                continue
-
+        for param_name, spec in self.parameters.items():
             # create Click parameters
             sensitive: bool = False
-            if self.pass_context and i == 0:
-                continue
-            if param_name in self.overrides:
-                param: click.Parameter = self.overrides[param_name]
+            if isinstance(spec, click.Parameter):
+                param: click.Parameter = spec
                 sensitive |= bool(param.envvar)
                 if isinstance(param, click.Option):
                     sensitive |= param.hide_input
-            elif param_name in self.arguments:
-                spec = self.arguments[param_name]
-                spec.kwargs["type"] = _types.click.get_click_type(
-                    spec.hint, config=self.config
-                )
+            elif spec.type is ParameterType.ARGUMENT:
                 param = click.Argument(spec.args, **spec.kwargs)
-            elif param_name in self.options:
-                spec = self.options[param_name]
-                spec.kwargs["type"] = _types.click.get_click_type(
-                    spec.hint, config=self.config
-                )
+            elif spec.type is ParameterType.OPTION:
                 param = click.Option(spec.args, **spec.kwargs)
-                hide_input = spec.kwargs.get("hide_input")
-                envvar = spec.kwargs.get("envvar")
-                sensitive |= hide_input or bool(envvar)
+                sensitive |= spec.sensitive
+            else:
+                msg = (
+                    f"Unable to determine whether parameter {param_name!r} "
+                    "is a command-line argument or option."
+                )
+                raise feud.exceptions.CompilationError(msg)
 
             # get renamed parameter if @feud.rename used
-            name: str = self.meta.names["params"].get(param_name, param_name)
+            name: str = self.names[param_name]
 
             # set parameter name
             param.name = name
@@ -115,19 +108,22 @@ class CommandState:
 
         # add any overrides that don't appear in function signature
         # e.g. version_option or anything else
-        for param_name, param in self.overrides.items():
-            if param_name not in sig.parameters:
-                params.append(param)
+        params.extend(
+            param
+            for param_name, param in self.overrides.items()
+            if param_name not in self.parameters
+        )
 
         # rename command if @feud.rename used
         if command_rename := self.meta.names["command"]:
-            self.click_kwargs = {**self.click_kwargs, "name": command_rename}
+            self.click_kwargs["name"] = command_rename
 
         # set help to docstring description if not provided
+        # (only retrieving the description when it is needed)
         if self.is_group:
             if "help" in self.click_kwargs:
                 self.click_kwargs["help"] = self.description
-        elif help_ := self.click_kwargs.get("help", self.description):
+        elif "help" not in self.click_kwargs and (help_ := self.description):
             self.click_kwargs["help"] = help_
 
         command = _decorators.validate_call(
@@ -136,8 +132,8 @@ class CommandState:
             param_renames=self.meta.names["params"],
             meta_vars=meta_vars,
             sensitive_vars=sensitive_vars,
-            positional=positional,
-            var_positional=var_positional,
+            positional=self.positional,
+            var_positional=self.var_positional,
             pydantic_kwargs=self.config.pydantic_kwargs,
         )
 
@@ -146,38 +142,156 @@ class CommandState:
 
         if click.is_rich:
             # apply rich-click styling
-            command = click.rich_config(
-                help_config=click.RichHelpConfiguration(
-                    **self.config.rich_click_kwargs
-                )
-            )(command)
+            command = get_rich_config(self.config.rich_click_kwargs)(command)
 
-        constructor = click.group if self.is_group else click.command
-        compiled: click.Command | click.Group = constructor(
-            **self.click_kwargs,
-        )(command)
-        compiled.params = params
+        return create_command(
+            command,
+            params=params,
+            click_kwargs=self.click_kwargs,
+            is_group=self.is_group,
+        )
 
-        return compiled
+    @property
+    def description(self) -> str | None:
+        if self.doc is None:
+            return None
+        return self.doc.description
 
     def get_meta_var(self, param: click.Parameter) -> str | None:
-        match param:
-            case click.Argument():
-                return param.make_metavar()
-            case click.Option():
-                return param.opts[0]
+        if isinstance(param, click.Argument):
+            return param.make_metavar()
+        if isinstance(param, click.Option):
+            return param.opts[0]
         return None
 
 
+def create_command(
+    func: t.Callable,
+    /,
+    *,
+    params: list[click.Parameter],
+    click_kwargs: dict[str, t.Any],
+    is_group: bool,
+) -> click.Command | click.Group:
+    """Instantiate the command or group class for a callback directly.
+
+    This is equivalent to ``click.command``/``click.group``, without the
+    decorator.
+    """
+    kwargs: dict[str, t.Any] = click_kwargs.copy()
+    kwargs.pop("params", None)
+    cls: type[click.Command] | None = kwargs.pop("cls", None)
+    if cls is None:
+        if click.is_rich:
+            cls = click.RichGroup if is_group else click.RichCommand
+        else:
+            cls = click.Group if is_group else click.Command
+    name: str | None = kwargs.pop("name", None)
+    if not name:
+        name = func.__name__.lower().replace("_", "-")
+    if kwargs.get("help") is None:
+        kwargs["help"] = func.__doc__
+    # parameters declared with click decorators are already in params
+    with contextlib.suppress(AttributeError):
+        del func.__click_params__  # type: ignore[attr-defined]
+
+    command: click.Command | click.Group = cls(
+        name=name, callback=func, params=params, **kwargs
+    )
+    command.__doc__ = func.__doc__
+    return command
+
+
+@ft.lru_cache(maxsize=256)
+def get_signature(func: t.Callable, /) -> inspect.Signature:
+    """Retrieve the signature of a function, evaluating string annotations.
+
+    The signature is cached as it is required each time the same function
+    is compiled into a command (e.g. when a group is subclassed).
+    """
+    return inspect.signature(func, eval_str=True)
+
+
+def get_rich_config(
+    rich_click_kwargs: dict[str, t.Any], /
+) -> t.Callable[[t.Callable], t.Callable]:
+    """Create a ``rich_click.rich_config`` decorator for styling settings.
+
+    Decorators are cached by settings (if hashable), so that the help
+    configuration is only created once for commands sharing the same
+    settings.
+    """
+    key = tuple(sorted(rich_click_kwargs.items()))
+    if is_hashable(key):
+        return _get_cached_rich_config(key)
+    return _get_rich_config(key)
+
+
+def is_hashable(obj: t.Any, /) -> bool:
+    try:
+        hash(obj)
+    except TypeError:
+        return False
+    return True
+
+
+@ft.lru_cache(maxsize=32)
+def _get_cached_rich_config(
+    key: tuple[tuple[str, t.Any], ...], /
+) -> t.Callable[[t.Callable], t.Callable]:
+    return _get_rich_config(key)
+
+
+def _get_rich_config(
+    key: tuple[tuple[str, t.Any], ...], /
+) -> t.Callable[[t.Callable], t.Callable]:
+    return click.rich_config(
+        help_config=click.RichHelpConfiguration(**dict(key))
+    )
+
+
+def get_overrides(func: t.Callable, /) -> dict[str, click.Parameter]:
+    """Retrieve the parameters declared on a function with click decorators
+    (key: parameter name).
+
+    The mapping is stored on the function and reused unless further click
+    parameters have been declared since.
+    """
+    params: list[click.Parameter] = getattr(func, "__click_params__", [])
+    if cached := getattr(func, "__feud_overrides__", None):
+        cached_params, size, overrides = cached
+        if cached_params is params and size == len(params):
+            return overrides
+    overrides = {override.name: override for override in params}
+    with contextlib.suppress(AttributeError):
+        func.__feud_overrides__ = (  # type: ignore[attr-defined]
+            params,
+            len(params),
+            overrides,
+        )
+    return overrides
+
+
 def pass_context(sig: inspect.Signature) -> bool:
     """Determine whether or not ``click.pass_context`` should be called.
 
-    Context is passed ff the first parameter if the function is named ``ctx``.
+    Context is passed if the first parameter of the function is named ``ctx``.
     """
-    param_name: str | None = dict(enumerate(sig.parameters)).get(0)
+    param_name: str | None = next(iter(sig.parameters), None)
     return param_name == CONTEXT_PARAM
 
 
+def is_flag(hint: t.Any) -> bool:
+    """Determine whether a type hint corresponds to a boolean flag."""
+    # fast path for common hints
+    if hint is bool:
+        return True
+    if hint in NON_FLAG_TYPES:
+        return False
+    base_type, _, _, _ = _types.click.get_base_type(hint)
+    return base_type is bool
+
+
 def get_option(name: str, *, hint: t.Any, negate_flags: bool) -> str:
     """Convert a name into a command-line option.
 
@@ -190,8 +304,7 @@ def get_option(name: str, *, hint: t.Any, negate_flags: bool) -> str:
     "--opt-name/--no-opt-name"
     """
     option: str = _inflect.optionize(name)
-    base_type, _, _, _ = _types.click.get_base_type(hint)
-    if base_type is bool and negate_flags:
+    if negate_flags and is_flag(hint):
         negated_option: str = _inflect.negate_option(option)
         return f"{option}/{negated_option}"
     return option
@@ -210,8 +323,7 @@ def get_alias(alias: str, *, hint: t.Any, negate_flags: bool) -> str:
     >>> get_alias("-a", hint=str, negate_flags=True)
     "-a"
     """
-    base_type, _, _, _ = _types.click.get_base_type(hint)
-    if base_type is bool and negate_flags:
+    if negate_flags and is_flag(hint):
         negated_alias: str = _inflect.negate_alias(alias)
         return f"{alias}/{negated_alias}"
     return alias
@@ -228,37 +340,57 @@ def sanitize_click_kwargs(
     click_kwargs.pop("commands", None)
     # sanitize the provided name
     # (only necessary for auto-naming a Group by class name)
-    click_kwargs["name"] = click_kwargs.get("name", _inflect.sanitize(name))
+    if "name" not in click_kwargs:
+        click_kwargs["name"] = _inflect.sanitize(name)
     # set help if provided
     if help_:
         click_kwargs["help"] = help_
 
 
 def build_command_state(  # noqa: PLR0915
-    state: CommandState, *, func: t.Callable, config: Config
+    state: CommandState,
+    *,
+    func: t.Callable,
+    sig: inspect.Signature,
+    config: Config,
 ) -> None:
-    doc: docstring_parser.Docstring
+    doc: _docstring.ParsedDocstring
     if state.is_group:
-        doc = docstring_parser.parse(state.click_kwargs.get("help", ""))
+        doc = _docstring.parse(state.click_kwargs.get("help", ""))
     else:
-        doc = docstring_parser.parse_from_object(func)
-
-    state.description = _docstring.get_description(doc)
-
-    sig: inspect.Signature = inspect.signature(func, eval_str=True)
+        doc = _docstring.parse_from_object(func)
+
+    state.doc = doc
+
+    state.pass_context = pass_context(sig)
+
+    # get renamed parameters if @feud.rename used
+    renames: dict[str, str] = state.meta.names["params"]
+    state.names = {
+        param: renames.get(param, param) for param in sig.parameters
+    }
+
+    for i, (param, spec) in enumerate(sig.parameters.items()):
+        kind = spec.kind
+        # store names of positional arguments
+        if kind in POSITIONAL_KINDS:
+            state.positional.append(param)
+        # store name of variable positional arguments (i.e. *args)
+        if kind is inspect.Parameter.VAR_POSITIONAL:
+            state.var_positional = param
+        # ignore variable keyword arguments (i.e. **kwargs)
+        if kind is inspect.Parameter.VAR_KEYWORD:
+            continue
+        # skip handling for click.Context argument
+        if state.pass_context and i == 0:
+            continue
 
-    for param, spec in sig.parameters.items():
         meta = ParameterSpec()
         meta.hint = spec.annotation
 
-        # get renamed parameter if @feud.rename used
-        name: str = state.meta.names["params"].get(param, param)
+        name: str = state.names[param]
 
-        if pass_context(sig) and param == CONTEXT_PARAM:
-            # skip handling for click.Context argument
-            state.pass_context = True
-
-        if spec.kind in (spec.POSITIONAL_ONLY, spec.POSITIONAL_OR_KEYWORD):
+        if kind in POSITIONAL_KINDS:
             # function positional arguments correspond to CLI arguments
             meta.type = ParameterType.ARGUMENT
 
@@ -294,7 +426,7 @@ def build_command_state(  # noqa: PLR0915
                 meta.kwargs["default"] = _types.defaults.convert_default(
                     spec.default
                 )
-        elif spec.kind == spec.KEYWORD_ONLY:
+        elif kind is inspect.Parameter.KEYWORD_ONLY:
             # function keyword-only arguments correspond to CLI options
             meta.type = ParameterType.OPTION
 
@@ -332,12 +464,11 @@ def build_command_state(  # noqa: PLR0915
             if env := state.meta.envs.get(param):
                 meta.kwargs["envvar"] = env
                 meta.kwargs["show_envvar"] = config.show_help_envvars
+                meta.sensitive = True
 
             # add help - fetch parameter description from docstring
-            if doc_param := next(
-                (p for p in doc.params if p.arg_name == param), None
-            ):
-                meta.kwargs["help"] = doc_param.description
+            if param in doc.params:
+                meta.kwargs["help"] = doc.params[param]
 
             # handle option default
             if spec.default is inspect._empty:  # noqa: SLF001
@@ -351,7 +482,7 @@ def build_command_state(  # noqa: PLR0915
                 meta.kwargs["default"] = _types.defaults.convert_default(
                     spec.default
                 )
-        elif spec.kind == spec.VAR_POSITIONAL:
+        elif kind is inspect.Parameter.VAR_POSITIONAL:
             # function positional arguments correspond to CLI arguments
             meta.type = ParameterType.ARGUMENT
 
@@ -371,11 +502,14 @@ def build_command_state(  # noqa: PLR0915
                 )
                 raise feud.exceptions.CompilationError(msg)
 
-        # add the parameter
-        if meta.type == ParameterType.ARGUMENT:
-            state.arguments[param] = meta
-        elif meta.type == ParameterType.OPTION:
-            state.options[param] = meta
+        # resolve click type (unless the parameter is overridden)
+        if param not in state.overrides:
+            meta.kwargs["type"] = _types.click.get_click_type(
+                meta.hint, config=config
+            )
+
+        # store the override (if provided) or parameter specification
+        state.parameters[param] = state.overrides.get(param, meta)
 
 
 def get_command(
@@ -393,14 +527,12 @@ def get_command(
         click_kwargs=click_kwargs,
         is_group=False,
         meta=getattr(func, "__feud__", _meta.FeudMeta()),
-        overrides={
-            override.name: override
-            for override in getattr(func, "__click_params__", [])
-        },
+        overrides=get_overrides(func),
     )
 
     # construct command state from signature
-    build_command_state(state, func=func, config=config)
+    sig: inspect.Signature = get_signature(func)
+    build_command_state(state, func=func, sig=sig, config=config)
 
     # generate click.Command and attach original function reference
     command = state.decorate(func)
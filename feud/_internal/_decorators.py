@@ -6,7 +6,6 @@
 from __future__ import annotations
 
 import functools as ft
-import inspect
 import re
 import typing as t
 
@@ -17,6 +16,17 @@ from feud import click
 
 AnyCallableT = t.TypeVar("AnyCallableT", bound=t.Callable[..., t.Any])
 
+# sentinel for arguments that were not provided
+MISSING = object()
+
+# patterns for reformatting pydantic errors
+VALIDATION_HEADER_PATTERN = re.compile(r"validation error(s?) for (.*)\n")
+EMPTY_INDEX_PATTERN = re.compile(r"\s\[\].*\n")
+ERROR_TYPE_PATTERN = re.compile(r"\[type=.*, (input_value=.*)")
+INPUT_TYPE_PATTERN = re.compile(r"(.*), input_type=.*\]")
+ERROR_URL_PATTERN = re.compile(r"\n\s+For further information visit.*(\n?)")
+SCHEMA_ERROR_PATTERN = re.compile(r'^Error building "call" validator:')
+
 
 def validate_call(
     func: t.Callable,
@@ -30,70 +40,84 @@ def validate_call(
     var_positional: str | None,
     pydantic_kwargs: dict[str, t.Any],
 ) -> t.Callable[[AnyCallableT], AnyCallableT]:
+    # mapping for reverting renamed options
+    inv_mapping = {v: k for k, v in param_renames.items()}
+
+    # validated function (created on first call, then reused)
+    validated_func: t.Callable | None = None
+
     @ft.wraps(func)
     def wrapper(*args: t.Any, **kwargs: t.Any) -> t.Callable:
+        nonlocal validated_func
         try:
             # move positional arguments
             for arg in positional:
-                pos_arg = kwargs.pop(arg, inspect._empty)  # noqa: SLF001
-                if pos_arg is not inspect._empty:  # noqa: SLF001
+                pos_arg = kwargs.pop(arg, MISSING)
+                if pos_arg is not MISSING:
                     args += (pos_arg,)
 
             # move *args to positional arguments
             if var_positional is not None:
-                var_pos_args = kwargs.pop(
-                    var_positional,
-                    inspect._empty,  # noqa: SLF001
-                )
-                if var_pos_args is not inspect._empty:  # noqa: SLF001
+                var_pos_args = kwargs.pop(var_positional, MISSING)
+                if var_pos_args is not MISSING:
                     args += var_pos_args
 
             # apply renaming for any options
-            inv_mapping = {v: k for k, v in param_renames.items()}
-            true_kwargs = {inv_mapping.get(k, k): v for k, v in kwargs.items()}
-
-            # create Pydantic configuration
-            config = pyd.ConfigDict(
-                **pydantic_kwargs,  # type: ignore[typeddict-item]
+            true_kwargs = (
+                {inv_mapping.get(k, k): v for k, v in kwargs.items()}
+                if inv_mapping
+                else kwargs
             )
 
+            if validated_func is None:
+                # create Pydantic configuration
+                config = pyd.ConfigDict(
+                    **pydantic_kwargs,  # type: ignore[typeddict-item]
+                )
+
+                # create the validated function
+                validated_func = pyd.validate_call(  # type: ignore[call-overload]
+                    func,
+                    config=config,
+                )
+
             # validate the function call
-            return pyd.validate_call(  # type: ignore[call-overload]
-                func,
-                config=config,
-            )(
-                *args,
-                **true_kwargs,
-            )
+            return validated_func(*args, **true_kwargs)
         except pyd.ValidationError as e:
-            msg = re.sub(
-                r"validation error(s?) for (.*)\n",
+            msg = VALIDATION_HEADER_PATTERN.sub(
                 rf"validation error\1 for command {name!r}\n",
                 str(e),
             )
             for param, meta_var in meta_vars.items():
-                msg = re.sub(
-                    rf"\n({param})(\.(\d+))?", rf"\n{meta_var} [\3]", msg
-                )
-                msg = re.sub(r"\s\[\].*\n", "\n", msg)
-                msg = re.sub(r"\[type=.*, (input_value=.*)", r"[\1", msg)
-                msg = re.sub(r"(.*), input_type=.*\]", r"\1]", msg)
-                msg = re.sub(
-                    r"\n\s+For further information visit.*(\n?)", r"\1", msg
+                param_pattern, input_pattern = get_param_patterns(
+                    param, meta_var
                 )
+                msg = param_pattern.sub(rf"\n{meta_var} [\3]", msg)
+                msg = EMPTY_INDEX_PATTERN.sub("\n", msg)
+                msg = ERROR_TYPE_PATTERN.sub(r"[\1", msg)
+                msg = INPUT_TYPE_PATTERN.sub(r"\1]", msg)
+                msg = ERROR_URL_PATTERN.sub(r"\1", msg)
                 if sensitive_vars[param]:
-                    msg = re.sub(
-                        rf"({meta_var}\s*\n\s.*\[input_value=).*(\])",
-                        r"\1hidden\2",
-                        msg,
-                    )
+                    msg = input_pattern.sub(r"\1hidden\2", msg)
             raise click.UsageError(msg) from None
         except pydc.SchemaError as e:
-            msg = re.sub(
-                r'^Error building "call" validator:',
+            msg = SCHEMA_ERROR_PATTERN.sub(
                 f"Error building command {name!r}",
                 str(e),
             )
             raise click.ClickException(msg) from None
 
     return wrapper  # type: ignore[return-value]
+
+
+@ft.lru_cache(maxsize=256)
+def get_param_patterns(
+    param: str, meta_var: str
+) -> tuple[re.Pattern[str], re.Pattern[str]]:
+    """Compile the patterns used to locate a parameter and its input value
+    within a pydantic validation error.
+    """
+    return (
+        re.compile(rf"\n({param})(\.(\d+))?"),
+        re.compile(rf"({meta_var}\s*\n\s.*\[input_value=).*(\])"),
+    )
@@ -5,15 +5,74 @@
 
 from __future__ import annotations
 
+import dataclasses
+import functools as ft
+import inspect
+import types
 import typing as t
 
-import docstring_parser
-
 from feud import click
 
+if t.TYPE_CHECKING:
+    import docstring_parser
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ParsedDocstring:
+    #: Description section of the docstring.
+    description: str | None
+    #: Parameter descriptions (key: parameter name).
+    params: types.MappingProxyType[str, str | None]
+
+
+@ft.lru_cache(maxsize=2048)
+def parse(docstring: str | None, /) -> ParsedDocstring:
+    """Parse a docstring.
+
+    Parsed docstrings are cached by their text, as the same docstring is
+    parsed each time its function is compiled into a command, as well as
+    when retrieving its description. As the result is shared, it is an
+    immutable summary rather than a :py:class:`docstring_parser.Docstring`.
+    """
+    import docstring_parser
+
+    return summarize(docstring_parser.parse(docstring))  # type: ignore[arg-type]
+
+
+def parse_from_object(obj: t.Any, /) -> ParsedDocstring:
+    """Parse the docstring of an object.
+
+    Attribute docstrings are only parsed for classes and modules
+    (see :py:func:`docstring_parser.parse_from_object`), so the docstrings of
+    any other objects are parsed with :py:func:`parse`.
+    """
+    if inspect.isclass(obj) or inspect.ismodule(obj):
+        import docstring_parser
+
+        return summarize(docstring_parser.parse_from_object(obj))
+    return parse(obj.__doc__)
+
+
+def summarize(doc: docstring_parser.Docstring, /) -> ParsedDocstring:
+    """Summarize a parsed docstring into its description and parameter
+    descriptions.
+    """
+    return ParsedDocstring(
+        description=get_description(doc),
+        params=types.MappingProxyType(
+            {param.arg_name: param.description for param in doc.params}
+        ),
+    )
+
 
 def get_description(
-    obj: docstring_parser.Docstring | click.Command | t.Callable | str,
+    obj: (
+        ParsedDocstring
+        | docstring_parser.Docstring
+        | click.Command
+        | t.Callable
+        | str
+    ),
     /,
 ) -> str | None:
     """Retrieve the description section of a docstring.
@@ -44,17 +103,18 @@ def get_description(
         CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
         SOFTWARE.
     """
-    doc: docstring_parser.Docstring | None = None
-
+    if isinstance(obj, ParsedDocstring):
+        return obj.description
     if isinstance(obj, str):
-        doc = docstring_parser.parse(obj)
-    elif isinstance(obj, click.Command):
+        return parse(obj).description
+    if isinstance(obj, click.Command):
         if func := getattr(obj, "__func__", None):
-            doc = docstring_parser.parse_from_object(func)
-    elif isinstance(obj, docstring_parser.Docstring):
-        doc = obj
-    elif callable(obj):
-        doc = docstring_parser.parse_from_object(obj)
+            return parse_from_object(func).description
+        return None
+    if callable(obj):
+        return parse_from_object(obj).description
+
+    doc: docstring_parser.Docstring = obj
 
     ret = None
     if doc:
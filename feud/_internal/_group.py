@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import inspect
 import typing as t
 
 from feud import click
@@ -21,18 +22,17 @@ def get_group(__cls: type[Group], /) -> click.Group:  # type[Group]
 
     state = _command.CommandState(
         config=__cls.__feud_config__,
-        click_kwargs=__cls.__feud_click_kwargs__,
+        # copy as the click kwargs are modified when decorating
+        click_kwargs={**__cls.__feud_click_kwargs__},
         is_group=True,
         meta=getattr(func, "__feud__", _meta.FeudMeta()),
-        overrides={
-            override.name: override
-            for override in getattr(func, "__click_params__", [])
-        },
+        overrides=_command.get_overrides(func),
     )
 
     # construct command state from signature
+    sig: inspect.Signature = _command.get_signature(func)
     _command.build_command_state(
-        state, func=func, config=__cls.__feud_config__
+        state, func=func, sig=sig, config=__cls.__feud_config__
     )
 
     # generate click.Group and attach original function reference
@@ -3,11 +3,20 @@
 # SPDX-License-Identifier: MIT
 # This source code is part of the Feud project (https://feud.wiki).
 
+import functools as ft
 import re
 import unicodedata
 
 __all__ = ["negate_alias", "negate_option", "optionize", "sanitize"]
 
+# patterns for parameterizing with the default separator
+UNWANTED_CHARS_PATTERN = re.compile(r"(?i)[^a-z0-9\-_]+")
+REPEATED_SEPARATOR_PATTERN = re.compile(r"-{2,}")
+EDGE_SEPARATOR_PATTERN = re.compile(r"(?i)^-|-$")
+
+# pattern for removing leading dashes
+LEADING_DASHES_PATTERN = re.compile(r"^-*(.*)")
+
 
 def transliterate(string: str) -> str:
     """Replace non-ASCII characters with an ASCII approximation. If no
@@ -46,6 +55,8 @@ def transliterate(string: str) -> str:
         CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
         SOFTWARE.
     """
+    if string.isascii():
+        return string
     normalized = unicodedata.normalize("NFKD", string)
     return normalized.encode("ascii", "ignore").decode("ascii")
 
@@ -85,8 +96,15 @@ def parameterize(string: str, separator: str = "-") -> str:
         SOFTWARE.
     """
     string = transliterate(string)
+    if separator == "-":
+        # Use precompiled patterns for the default separator
+        string = UNWANTED_CHARS_PATTERN.sub(separator, string)
+        string = REPEATED_SEPARATOR_PATTERN.sub(separator, string)
+        string = EDGE_SEPARATOR_PATTERN.sub("", string)
+        return string.lower()
+
     # Turn unwanted chars into the separator
-    string = re.sub(r"(?i)[^a-z0-9\-_]+", separator, string)
+    string = UNWANTED_CHARS_PATTERN.sub(separator, string)
     if separator:
         re_sep = re.escape(separator)
         # No more than one of the separator in a row.
@@ -97,6 +115,7 @@ def parameterize(string: str, separator: str = "-") -> str:
     return string.lower()
 
 
+@ft.lru_cache(maxsize=256)
 def sanitize(name: str) -> str:
     """Sanitizes a string for preparation of usage as a command-line option.
 
@@ -106,7 +125,7 @@ def sanitize(name: str) -> str:
     "a-b_c"
     """
     name = parameterize(name)
-    return re.sub(r"^-*(.*)", r"\1", name)
+    return LEADING_DASHES_PATTERN.sub(r"\1", name)
 
 
 def optionize(name: str) -> str:
@@ -120,6 +139,7 @@ def optionize(name: str) -> str:
     return "--" + sanitize(name)
 
 
+@ft.lru_cache(maxsize=1024)
 def negate_option(option: str) -> str:
     """Negates a command-line option (for boolean flags).
 
@@ -131,6 +151,7 @@ def negate_option(option: str) -> str:
     return "--no" + option.removeprefix("-")
 
 
+@ft.lru_cache(maxsize=1024)
 def negate_alias(alias: str) -> str:
     """Negates an alias for a boolean flag.
 
@@ -16,6 +16,16 @@ from feud.core.command import command
 if t.TYPE_CHECKING:
     from feud.core.group import Group
 
+# names of configuration fields (for separating class keyword arguments)
+CONFIG_FIELDS: frozenset[str] = frozenset(Config.model_fields)
+
+
+def get_set_fields(config: Config) -> dict[str, t.Any]:
+    """Retrieve the explicitly set fields of a configuration, without
+    serializing it through ``model_dump``.
+    """
+    return {field: getattr(config, field) for field in config.model_fields_set}
+
 
 class GroupBase(abc.ABCMeta):
     def __new__(
@@ -53,8 +63,10 @@ class GroupBase(abc.ABCMeta):
         if bases:
             base_config: Config | None = None
             click_kwargs: dict[str, t.Any] = {}
-            subgroups: list[type] = []  # type[Group], but circular import
-            commands: list[str] = []
+            # ordered sets (dict keys) for de-duplication
+            # (subgroups are type[Group], but circular import)
+            subgroups: dict[type, None] = {}
+            commands: dict[str, None] = {}
 
             # extend/inherit information from parent group if subclassed
             help_: str | None = None
@@ -63,22 +75,14 @@ class GroupBase(abc.ABCMeta):
                     # NOTE: may want **dict(config) depending on behaviour
                     base_config = Config._create(  # noqa: SLF001
                         base=base_config,
-                        **config.model_dump(exclude_unset=True),
+                        **get_set_fields(config),
                     )
                     click_kwargs = {
                         **click_kwargs,
                         **base.__feud_click_kwargs__,
                     }
-                    subgroups += [
-                        subgroup
-                        for subgroup in base.__feud_subgroups__
-                        if subgroup not in subgroups
-                    ]
-                    commands += [
-                        cmd
-                        for cmd in base.__feud_commands__
-                        if cmd not in commands
-                    ]
+                    subgroups.update(dict.fromkeys(base.__feud_subgroups__))
+                    commands.update(dict.fromkeys(base.__feud_commands__))
                     help_ = base.__feud_click_kwargs__.get("help")
 
             # deconstruct base config, override config kwargs and click kwargs
@@ -87,14 +91,10 @@ class GroupBase(abc.ABCMeta):
                 if k == "config":
                     # NOTE: may want base_config = v depending on behaviour
                     base_config = Config._create(  # noqa: SLF001
-                        base=base_config, **v.model_dump(exclude_unset=True)
+                        base=base_config, **get_set_fields(v)
                     )
                 else:
-                    d = (
-                        config_kwargs
-                        if k in Config.model_fields
-                        else click_kwargs
-                    )
+                    d = config_kwargs if k in CONFIG_FIELDS else click_kwargs
                     d[k] = v
 
             # sanitize click kwargs
@@ -102,30 +102,29 @@ class GroupBase(abc.ABCMeta):
                 click_kwargs, name=cls_name, help_=help_
             )
 
-            # members to consider as commands
-            funcs = {
-                name: attr
-                for name, attr in namespace.items()
-                if callable(attr) and not name.startswith("_")
-            }
-
             # set config and click kwargs
             # (override feud.command decorator settings)
-            namespace["__feud_config__"] = Config._create(  # noqa: SLF001
-                base=base_config, **config_kwargs
+            # (inherited configuration is reused as-is if nothing overrides it)
+            config = (
+                base_config
+                if base_config is not None and not config_kwargs
+                else Config._create(base=base_config, **config_kwargs)  # noqa: SLF001
             )
+            namespace["__feud_config__"] = config
             namespace["__feud_click_kwargs__"] = click_kwargs
-            namespace["__feud_subgroups__"] = subgroups
-            namespace["__feud_commands__"] = commands + [
-                func for func in funcs if func not in commands
-            ]
-
-            # auto-generate commands
-            for name, func in funcs.items():
-                if not isinstance(func, click.Command):
-                    namespace[name] = command(
-                        func, config=namespace["__feud_config__"]
-                    )
+            namespace["__feud_subgroups__"] = list(subgroups)
+
+            # consider public callable members as commands
+            # and auto-generate commands (in a single pass over members)
+            for name, attr in namespace.items():
+                if not callable(attr) or name.startswith("_"):
+                    continue
+                commands[name] = None
+                if not isinstance(attr, click.Command):
+                    # only replaces an existing key (safe during iteration)
+                    namespace[name] = command(attr, config=config)
+
+            namespace["__feud_commands__"] = list(commands)
 
         group: type[Group] = super().__new__(  # type: ignore[assignment]
             __cls,
@@ -6,15 +6,18 @@
 from __future__ import annotations
 
 import dataclasses
-from collections import defaultdict
+import typing as t
 
 from feud import click
 from feud._internal import _meta
 
+try:
+    from rich_click.utils import CommandGroupDict, OptionGroupDict
+except ImportError:
+    CommandGroupDict = OptionGroupDict = dict  # type: ignore[assignment, misc]
 
-def add_command_sections(group: click.Group, context: list[str]) -> None:
-    from rich_click.utils import CommandGroupDict
 
+def add_command_sections(group: click.Group, context: list[str]) -> None:
     if feud_group := getattr(group, "__group__", None):
         command_groups: dict[str, list[CommandGroupDict]] = {
             " ".join(context): [
@@ -60,31 +63,25 @@ def add_option_sections(
         update_command(obj, context=context)
 
 
-def get_opts(option: str, *, command: click.Command) -> list[str]:
+def get_name_map(command: click.Command) -> t.Callable[[str], str]:
     func = command.__func__  # type: ignore[attr-defined]
-    name_map = lambda name: name  # noqa: E731
     meta: _meta.FeudMeta | None = getattr(func, "__feud__", None)
     if meta and meta.names:
-        names = meta.names
-        name_map = lambda name: names["params"].get(name, name)  # noqa: E731
-    return next(
-        param.opts
-        for param in command.params
-        if param.name == name_map(option)
-    )
+        names = meta.names["params"]
+        return lambda name: names.get(name, name)
+    return lambda name: name
 
 
 def update_command(command: click.Command, context: list[str]) -> None:
-    from rich_click.utils import OptionGroupDict
-
     if func := getattr(command, "__func__", None):
         meta: _meta.FeudMeta | None = getattr(func, "__feud__", None)
         if meta and meta.sections:
-            options = meta.sections
-            sections = defaultdict(list)
-            for option, section_name in options.items():
-                opts: list[str] = get_opts(option, command=command)
-                sections[section_name].append(opts[0])
+            opts_by_name = {param.name: param.opts for param in command.params}
+            name_map = get_name_map(command)
+            sections: dict[str, list[str]] = {}
+            for option, section_name in meta.sections.items():
+                opts: list[str] = opts_by_name[name_map(option)]
+                sections.setdefault(section_name, []).append(opts[0])
             option_groups: dict[str, list[OptionGroupDict]] = {
                 " ".join(context): [
                     OptionGroupDict(name=name, options=options)
@@ -32,23 +32,30 @@ PATH_TYPES = (
     pathlib.WindowsPath,
 )
 
-DATE_TYPES = (
-    datetime.date,
-    pyd.PastDate,
-    pyd.FutureDate,
+DATE_TYPES = frozenset(
+    {
+        datetime.date,
+        pyd.PastDate,
+        pyd.FutureDate,
+    }
 )
 
-TIME_TYPES = (datetime.time,)
+TIME_TYPES = frozenset({datetime.time})
 
-DATETIME_TYPES = (
-    datetime.datetime,
-    pyd.PastDatetime,
-    pyd.FutureDatetime,
-    pyd.AwareDatetime,
-    pyd.NaiveDatetime,
+DATETIME_TYPES = frozenset(
+    {
+        datetime.datetime,
+        pyd.PastDatetime,
+        pyd.FutureDatetime,
+        pyd.AwareDatetime,
+        pyd.NaiveDatetime,
+    }
 )
 
-TIMEDELTA_TYPES = (datetime.timedelta,)
+TIMEDELTA_TYPES = frozenset({datetime.timedelta})
+
+# click path types are stateless, so one instance is shared by all path types
+PATH_CLICK_TYPE = click.Path()
 
 BASE_TYPES: dict[type, click.ParamType] = {
     str: click.STRING,
@@ -58,111 +65,136 @@ BASE_TYPES: dict[type, click.ParamType] = {
     fractions.Fraction: click.FLOAT,
     bool: click.BOOL,
     uuid.UUID: click.UUID,
-    **{path_type: click.Path() for path_type in PATH_TYPES},
+    **dict.fromkeys(PATH_TYPES, PATH_CLICK_TYPE),
 }
 
-EXTRA_TYPES: dict[type, click.ParamType | tuple[click.ParamType, ...]]
+ExtraTypes = dict[type, t.Union[click.ParamType, tuple[click.ParamType, ...]]]
 
-try:
-    import packaging.version
-    import pydantic_extra_types
-
-    version: packaging.version.Version = packaging.version.parse(
-        pydantic_extra_types.__version__,
-    )
 
-    from pydantic_extra_types.color import Color
-    from pydantic_extra_types.coordinate import (
-        Coordinate,
-        Latitude,
-        Longitude,
-    )
-    from pydantic_extra_types.country import (
-        CountryAlpha2,
-        CountryAlpha3,
-        CountryNumericCode,
-        CountryShortName,
-    )
-    from pydantic_extra_types.mac_address import MacAddress
-    from pydantic_extra_types.payment import PaymentCardNumber
-    from pydantic_extra_types.phone_numbers import PhoneNumber
-    from pydantic_extra_types.routing_number import ABARoutingNumber
-
-    # NOTE: PaymentCardBrand is skipped as it is just an enum
-    EXTRA_TYPES = {
-        Color: click.STRING,
-        Coordinate: (click.FLOAT, click.FLOAT),
-        Latitude: click.FLOAT,
-        Longitude: click.FLOAT,
-        CountryAlpha2: click.STRING,
-        CountryAlpha3: click.STRING,
-        CountryNumericCode: click.STRING,
-        CountryShortName: click.STRING,
-        MacAddress: click.STRING,
-        PaymentCardNumber: click.STRING,
-        PhoneNumber: click.STRING,
-        ABARoutingNumber: click.STRING,
-    }
+@ft.cache
+def get_extra_types() -> ExtraTypes:
+    """Retrieve click types for ``pydantic-extra-types`` types.
 
-    if version >= packaging.version.parse("2.2.0"):
-        from pydantic_extra_types.ulid import ULID
+    These are only imported when a hint from ``pydantic-extra-types`` is
+    first resolved, as importing them is comparatively slow.
+    """
+    try:
+        import packaging.version
+        import pydantic_extra_types
+
+        # release tuple is parsed once and compared against integer tuples
+        version: tuple[int, ...] = packaging.version.parse(
+            pydantic_extra_types.__version__,
+        ).release
+
+        from pydantic_extra_types.color import Color
+        from pydantic_extra_types.coordinate import (
+            Coordinate,
+            Latitude,
+            Longitude,
+        )
+        from pydantic_extra_types.country import (
+            CountryAlpha2,
+            CountryAlpha3,
+            CountryNumericCode,
+            CountryShortName,
+        )
+        from pydantic_extra_types.mac_address import MacAddress
+        from pydantic_extra_types.payment import PaymentCardNumber
+        from pydantic_extra_types.phone_numbers import PhoneNumber
+        from pydantic_extra_types.routing_number import ABARoutingNumber
+
+        # NOTE: PaymentCardBrand is skipped as it is just an enum
+        extra_types: ExtraTypes = {
+            Color: click.STRING,
+            Coordinate: (click.FLOAT, click.FLOAT),
+            Latitude: click.FLOAT,
+            Longitude: click.FLOAT,
+            CountryAlpha2: click.STRING,
+            CountryAlpha3: click.STRING,
+            CountryNumericCode: click.STRING,
+            CountryShortName: click.STRING,
+            MacAddress: click.STRING,
+            PaymentCardNumber: click.STRING,
+            PhoneNumber: click.STRING,
+            ABARoutingNumber: click.STRING,
+        }
+
+        if version >= (2, 2, 0):
+            from pydantic_extra_types.ulid import ULID
+
+            extra_types[ULID] = click.STRING
+
+        if version < (2, 4, 0):
+            from pydantic_extra_types.country import (  # type: ignore[attr-defined]
+                CountryOfficialName,
+            )
 
-        EXTRA_TYPES[ULID] = click.STRING
+            extra_types[CountryOfficialName] = click.STRING
 
-    if version < packaging.version.parse("2.4.0"):
-        from pydantic_extra_types.country import (  # type: ignore[attr-defined]
-            CountryOfficialName,
-        )
+        if version >= (2, 4, 0):
+            from pydantic_extra_types.isbn import ISBN
 
-        EXTRA_TYPES[CountryOfficialName] = click.STRING
+            extra_types[ISBN] = click.STRING
 
-    if version >= packaging.version.parse("2.4.0"):
-        from pydantic_extra_types.isbn import ISBN
+        if version >= (2, 7, 0):
+            from pydantic_extra_types.language_code import (
+                LanguageAlpha2,
+                LanguageName,
+            )
 
-        EXTRA_TYPES[ISBN] = click.STRING
+            extra_types[LanguageAlpha2] = click.STRING
+            extra_types[LanguageName] = click.STRING
 
-    if version >= packaging.version.parse("2.7.0"):
-        from pydantic_extra_types.language_code import (
-            LanguageAlpha2,
-            LanguageName,
-        )
+        if version >= (2, 9, 0):
+            from pydantic_extra_types.semantic_version import SemanticVersion
 
-        EXTRA_TYPES[LanguageAlpha2] = click.STRING
-        EXTRA_TYPES[LanguageName] = click.STRING
+            extra_types[SemanticVersion] = click.STRING
 
-    if version >= packaging.version.parse("2.9.0"):
-        from pydantic_extra_types.semantic_version import SemanticVersion
+        if version >= (2, 10, 0):
+            from pydantic_extra_types.s3 import S3Path
 
-        EXTRA_TYPES[SemanticVersion] = click.STRING
+            # NOTE: pathlib.Path isn't ideal for S3 paths
+            extra_types[S3Path] = click.STRING
 
-    if version >= packaging.version.parse("2.10.0"):
-        from pydantic_extra_types.s3 import S3Path
+    except ImportError:
+        extra_types = {}
 
-        # NOTE: pathlib.Path isn't ideal for S3 paths
-        EXTRA_TYPES[S3Path] = click.STRING
+    return extra_types
 
-except ImportError:
-    EXTRA_TYPES = {}
 
-COLLECTION_TYPES: tuple[type, ...] = (
-    tuple,
-    list,
-    set,
-    frozenset,
-    collections.deque,
+COLLECTION_TYPES: frozenset[type] = frozenset(
+    {
+        tuple,
+        list,
+        set,
+        frozenset,
+        collections.deque,
+    }
 )
 
 DEFAULT_TYPE = None
 
-PathType = t.Union[*PATH_TYPES]  # type: ignore[valid-type]
-ClickType = t.Union[  # type: ignore[valid-type]
-    *BASE_TYPES.values(),
-    type(DEFAULT_TYPE),
-]
-AnnotatedArgDict = t.Dict[int, t.Any]
+if t.TYPE_CHECKING:
+    # only used in annotations, so not built at runtime
+    PathType = t.Union[*PATH_TYPES]  # type: ignore[valid-type]
+    ClickType = t.Union[  # type: ignore[valid-type]
+        *BASE_TYPES.values(),
+        type(DEFAULT_TYPE),
+    ]
+
+AnnotatedArgs = t.Tuple[t.Any, ...]
+
+
+@ft.cache
+def get_type_adapter(hint: type) -> pyd.TypeAdapter:
+    """Retrieve a (cached) type adapter for a date/time type."""
+    return pyd.TypeAdapter(hint)
 
 
 class DateTime(click.DateTime):
+    __slots__ = ("_datetime_type", "_show_default_format")
+
     def __init__(
         self,
         *args: t.Any,
@@ -191,12 +223,92 @@ class DateTime(click.DateTime):
         format: str,  # noqa: A002, ARG002
     ) -> t.Any | None:
         try:
-            return pyd.TypeAdapter(self._datetime_type).validate_python(value)
+            adapter = get_type_adapter(self._datetime_type)
+            return adapter.validate_python(value)
         except pyd.ValidationError:
             return None
 
 
+# date/time click types, only requiring show_default_format (key: type)
+DATETIME_CLICK_TYPES: dict[type, ft.partial[DateTime]] = {
+    **dict.fromkeys(
+        DATE_TYPES,
+        ft.partial(
+            DateTime,
+            formats=["YYYY-MM-DD"],
+            datetime_type=datetime.date,
+        ),
+    ),
+    **dict.fromkeys(
+        TIME_TYPES,
+        ft.partial(
+            DateTime,
+            formats=["HH:MM[:SS[.ffffff]][Z or [±]HH[:]MM]"],
+            datetime_type=datetime.time,
+        ),
+    ),
+    **dict.fromkeys(
+        DATETIME_TYPES,
+        ft.partial(
+            DateTime,
+            formats=["YYYY-MM-DD[T]HH:MM[:SS[.ffffff]][Z or [±]HH[:]MM]"],
+            datetime_type=datetime.datetime,
+        ),
+    ),
+    **dict.fromkeys(
+        TIMEDELTA_TYPES,
+        ft.partial(
+            DateTime,
+            formats=[
+                "[-][DD ][HH:MM]SS[.ffffff]",
+                "[±]P[DD]DT[HH]H[MM]M[SS]S",
+            ],
+            datetime_type=datetime.timedelta,
+        ),
+    ),
+}
+
+# constrained pydantic click types (key: annotated type and first metadata)
+ANNOTATED_CLICK_TYPES: dict[AnnotatedArgs, t.Callable[[], click.ParamType]] = {
+    # integer types
+    t.get_args(pyd.PositiveInt): ft.partial(
+        click.IntRange, min=0, min_open=True
+    ),
+    t.get_args(pyd.NonNegativeInt): ft.partial(
+        click.IntRange, min=0, min_open=False
+    ),
+    t.get_args(pyd.NegativeInt): ft.partial(
+        click.IntRange, max=0, max_open=True
+    ),
+    t.get_args(pyd.NonPositiveInt): ft.partial(
+        click.IntRange, max=0, max_open=False
+    ),
+    # float types
+    t.get_args(pyd.PositiveFloat): ft.partial(
+        click.FloatRange, min=0, min_open=True
+    ),
+    t.get_args(pyd.NonNegativeFloat): ft.partial(
+        click.FloatRange, min=0, min_open=False
+    ),
+    t.get_args(pyd.NegativeFloat): ft.partial(
+        click.FloatRange, max=0, max_open=True
+    ),
+    t.get_args(pyd.NonPositiveFloat): ft.partial(
+        click.FloatRange, max=0, max_open=False
+    ),
+    # file / directory types
+    t.get_args(pyd.FilePath): ft.partial(
+        click.Path, exists=True, dir_okay=False
+    ),
+    t.get_args(pyd.DirectoryPath): ft.partial(
+        click.Path, exists=True, file_okay=False
+    ),
+}
+
+
 class Union(click.ParamType):
+    __slots__ = ("types",)
+
     def __init__(
         self,
         *args: t.Any,
@@ -225,10 +337,52 @@ class Union(click.ParamType):
         return " | ".join(unique_metavars)
 
 
+def get_cache_key(hint: t.Any) -> tuple[t.Any, str] | None:
+    """Build a cache key for a type hint, or ``None`` if it is unhashable.
+
+    The representation of the hint is included in the key as ``typing``
+    equality disregards argument order for ``t.Literal`` and ``t.Union``,
+    which would otherwise affect the order of choices and metavars.
+    """
+    key = (hint, repr(hint))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
 def get_click_type(
     hint: t.Any,
     *,
     config: Config,
+) -> ClickType | None:  # type: ignore[valid-type]
+    """Resolve a Click type for the provided type hint.
+
+    Resolved types are cached by type hint and the configuration fields that
+    are used during resolution.
+    """
+    key = get_cache_key(hint)
+    if key is None:
+        return _get_click_type(hint, config=config)
+    return _get_cached_click_type(key, config.show_help_datetime_formats)
+
+
+@ft.lru_cache(maxsize=512)
+def _get_cached_click_type(
+    key: tuple[t.Any, str],
+    show_help_datetime_formats: bool,  # noqa: FBT001
+) -> ClickType | None:  # type: ignore[valid-type]
+    config = Config._create(  # noqa: SLF001
+        show_help_datetime_formats=show_help_datetime_formats,
+    )
+    return _get_click_type(key[0], config=config)
+
+
+def _get_click_type(
+    hint: t.Any,
+    *,
+    config: Config,
 ) -> ClickType | None:  # type: ignore[valid-type]
     base_type, base_args, _, _ = get_base_type(hint)
     origin_type = t.get_origin(base_type)
@@ -237,7 +391,7 @@ def get_click_type(
     if click_type and origin_type in COLLECTION_TYPES:
         return click_type
 
-    click_type = resolve_collection(base_type, args={}, config=config)
+    click_type = resolve_collection(base_type, args=(), config=config)
     if click_type and is_namedtuple(base_type):
         return click_type
 
@@ -254,90 +408,83 @@ def resolve_type(
         click_type = resolve_annotated(base_type, parent_args=parent_args)
         if click_type:
             return click_type
-    if t.get_origin(base_type) is t.Literal:
-        return click.Choice(list(map(str, base_args.values())))
-    if t.get_origin(base_type) in (t.Union, types.UnionType):
+    base_origin = t.get_origin(base_type)
+    if base_origin is t.Literal:
+        return click.Choice(list(map(str, base_args)))
+    if base_origin in (t.Union, types.UnionType):
         # only try to determine type for
         # t.Optional[t.Any] / t.Union[t.Any, None]
-        arg_values = base_args.values()
-        if len(base_args) == 2 and type(None) in arg_values:
-            non_none = next(arg for arg in arg_values if arg is not type(None))
+        if len(base_args) == 2 and type(None) in base_args:
+            non_none = next(arg for arg in base_args if arg is not type(None))
             return get_click_type(non_none, config=config)
         # t.Union with more than one non-None argument
-        base_types = list(
-            map(
-                ft.partial(get_click_type, config=config),
-                base_args.values(),
-            )
-        )
+        base_types = [get_click_type(arg, config=config) for arg in base_args]
         return Union(types=base_types)  # type: ignore[arg-type]
     if inspect.isclass(base_type):
         if issubclass(base_type, enum.Enum):
             return click.Choice([str(e.value) for e in base_type])
-        if base_type in DATE_TYPES:
-            return DateTime(
-                formats=["YYYY-MM-DD"],
-                datetime_type=datetime.date,
+        if datetime_type := DATETIME_CLICK_TYPES.get(base_type):
+            return datetime_type(
                 show_default_format=config.show_help_datetime_formats,
             )
-        if base_type in TIME_TYPES:
-            return DateTime(
-                formats=["HH:MM[:SS[.ffffff]][Z or [±]HH[:]MM]"],
-                datetime_type=datetime.time,
-                show_default_format=config.show_help_datetime_formats,
-            )
-        if base_type in DATETIME_TYPES:
-            return DateTime(
-                formats=["YYYY-MM-DD[T]HH:MM[:SS[.ffffff]][Z or [±]HH[:]MM]"],
-                datetime_type=datetime.datetime,
-                show_default_format=config.show_help_datetime_formats,
-            )
-        if base_type in TIMEDELTA_TYPES:
-            return DateTime(
-                formats=[
-                    "[-][DD ][HH:MM]SS[.ffffff]",
-                    "[±]P[DD]DT[HH]H[MM]M[SS]S",
-                ],
-                datetime_type=datetime.timedelta,
-                show_default_format=config.show_help_datetime_formats,
-            )
-        if base_type in EXTRA_TYPES:
-            return EXTRA_TYPES[base_type]
+        if base_type.__module__.startswith("pydantic_extra_types."):
+            return get_extra_types().get(base_type, DEFAULT_TYPE)
     return BASE_TYPES.get(base_type, DEFAULT_TYPE)
 
 
-def get_arg_dict(hint: t.Annotated[t.Any, ...]) -> AnnotatedArgDict:
-    """Convert the arguments of an annotated type into a dictionary.
-
-    Dictionary is keyed by argument index.
+def get_arg(args: AnnotatedArgs, index: int) -> t.Any | None:
+    """Retrieve the argument of a type at an index, or ``None`` if there is
+    no argument at that index.
     """
-    return dict(enumerate(t.get_args(hint)))
+    return args[index] if index < len(args) else None
 
 
 def get_base_type(
     hint: t.Any,
-    *,
-    parent_args: AnnotatedArgDict | None = None,
-    parent_type: t.Any | None = None,
-) -> tuple[t.Any, AnnotatedArgDict, t.Any | None, AnnotatedArgDict | None]:
+) -> tuple[t.Any, AnnotatedArgs, t.Any | None, AnnotatedArgs | None]:
     """Retrieve the inner type and arguments of a type.
 
     Can be annotated or non-annotated. Also returns outer type and arguments.
 
+    Results are cached by type hint.
+
     Examples
     --------
     >>> import typing as t
     >>> get_base_type(t.Annotated[t.Tuple[int, ...], "annotation"])
     (
         typing.Tuple[int, ...],
-        {0: <class 'int'>, 1: Ellipsis},
+        (<class 'int'>, Ellipsis),
         typing.Annotated[typing.Tuple[int, ...], 'annotation'],
-        {0: typing.Tuple[int, ...], 1: 'annotation'}
+        (typing.Tuple[int, ...], 'annotation')
     )
     """
-    args = get_arg_dict(hint)
-    if t.get_origin(hint) is t.Annotated:
-        return get_base_type(args[0], parent_type=hint, parent_args=args)
+    key = get_cache_key(hint)
+    if key is None:
+        return _get_base_type(hint)
+    return _get_cached_base_type(key)
+
+
+@ft.lru_cache(maxsize=512)
+def _get_cached_base_type(
+    key: tuple[t.Any, str],
+) -> tuple[t.Any, AnnotatedArgs, t.Any | None, AnnotatedArgs | None]:
+    return _get_base_type(key[0])
+
+
+def _get_base_type(
+    hint: t.Any,
+    *,
+    parent_args: AnnotatedArgs | None = None,
+    parent_type: t.Any | None = None,
+) -> tuple[t.Any, AnnotatedArgs, t.Any | None, AnnotatedArgs | None]:
+    origin = t.get_origin(hint)
+    if origin is None:
+        # non-generic types have no arguments
+        return hint, (), parent_type, parent_args
+    args = t.get_args(hint)
+    if origin is t.Annotated:
+        return _get_base_type(args[0], parent_type=hint, parent_args=args)
     return hint, args, parent_type, parent_args
 
 
@@ -383,21 +530,22 @@ def is_collection_type(hint: t.Any) -> tuple[bool, t.Any | None]:
     (False, None)
     """
     base_type, base_args, _, _ = get_base_type(hint)
+    origin = t.get_origin(base_type)
 
-    if base_type in COLLECTION_TYPES:
+    # only check non-generic types, as generics may be unhashable
+    if origin is None and base_type in COLLECTION_TYPES:
         return True, None
 
-    origin = t.get_origin(base_type)
     if origin in COLLECTION_TYPES:
         if origin is tuple:
             if len(base_args) == 0:
                 # typing.Tuple
                 return True, None
-            if len(base_args) == 2 and base_args.get(1) is Ellipsis:
+            if len(base_args) == 2 and base_args[1] is Ellipsis:
                 # typing.Tuple[typing.Any, ...]
-                return True, base_args.get(0)
+                return True, base_args[0]
             return False, None
-        return True, base_args.get(0)
+        return True, get_arg(base_args, 0)
 
     return False, None
 
@@ -405,7 +553,7 @@ def is_collection_type(hint: t.Any) -> tuple[bool, t.Any | None]:
 def resolve_collection(
     hint: t.Any,
     *,
-    args: AnnotatedArgDict,
+    args: AnnotatedArgs,
     config: Config,
 ) -> ClickType | None:  # type: ignore[valid-type]
     """Resolve a Click type for the provided collection type.
@@ -419,61 +567,45 @@ def resolve_collection(
     >>> from feud._internal import _types
     >>> _types.click.resolve_collection(
     ...     tuple,
-    ...     args={0: t.conint(ge=0, le=3), 1: ...},
+    ...     args=(t.conint(ge=0, le=3), ...),
     ...     config=Config._create()
     ... )
     click.IntRange(min=0, max=3, min_open=False, max_open=False)
     """
     if hint is tuple and len(args):
         # arbitrary size tuple - t.Tuple[t.Any, ...]
-        if args.get(1) is Ellipsis:
+        if get_arg(args, 1) is Ellipsis:
             return resolve_type(args[0], config=config)
         # fixed size tuple, e.g. t.Tuple[t.Any, t.Any]
-        return tuple(
-            map(ft.partial(resolve_type, config=config), args.values())
-        )
+        return tuple([resolve_type(arg, config=config) for arg in args])
     if is_namedtuple(hint):
         return tuple(
-            map(
-                ft.partial(resolve_type, config=config),
-                hint.__annotations__.values(),
-            )
+            [
+                resolve_type(arg, config=config)
+                for arg in hint.__annotations__.values()
+            ]
         )
     if hint in (list, set, frozenset, collections.deque):
         # Type[t.Any]
-        return resolve_type(args.get(0), config=config)
+        return resolve_type(get_arg(args, 0), config=config)
     return None
 
 
 def resolve_annotated(
     base_type: t.Any,
     *,
-    parent_args: AnnotatedArgDict | None,
+    parent_args: AnnotatedArgs | None,
 ) -> ClickType | None:  # type: ignore[valid-type]
     if parent_args is None:
         return None
 
-    arg_list = list(parent_args.values())
-    two_field_subtype = t.Annotated[*arg_list[:2]]  # type: ignore[valid-type]
-    # integer types
-    if two_field_subtype == pyd.PositiveInt:
-        return click.IntRange(min=0, min_open=True)
-    if two_field_subtype == pyd.NonNegativeInt:
-        return click.IntRange(min=0, min_open=False)
-    if two_field_subtype == pyd.NegativeInt:
-        return click.IntRange(max=0, max_open=True)
-    if two_field_subtype == pyd.NonPositiveInt:
-        return click.IntRange(max=0, max_open=False)
-
-    # float types
-    if two_field_subtype == pyd.PositiveFloat:
-        return click.FloatRange(min=0, min_open=True)
-    if two_field_subtype == pyd.NonNegativeFloat:
-        return click.FloatRange(min=0, min_open=False)
-    if two_field_subtype == pyd.NegativeFloat:
-        return click.FloatRange(max=0, max_open=True)
-    if two_field_subtype == pyd.NonPositiveFloat:
-        return click.FloatRange(max=0, max_open=False)
+    # integer / float / file / directory types
+    try:
+        if click_type := ANNOTATED_CLICK_TYPES.get(parent_args[:2]):
+            return click_type()
+    except TypeError:
+        # unhashable metadata
+        pass
 
     # int / float / decimal range types
     if interval := get_interval(parent_args):
@@ -482,19 +614,15 @@ def resolve_annotated(
         if base_type in (float, decimal.Decimal):
             return get_click_range_type(interval, click.FloatRange)
 
-    # file / directory types
-    if two_field_subtype == pyd.FilePath:
-        return click.Path(exists=True, dir_okay=False)
-    if two_field_subtype == pyd.DirectoryPath:
-        return click.Path(exists=True, file_okay=False)
+    # path types
     if base_type in PATH_TYPES:
-        return click.Path()
+        return PATH_CLICK_TYPE
 
     return None
 
 
-def get_interval(parent_args: AnnotatedArgDict) -> ta.Interval | None:
-    for v in parent_args.values():
+def get_interval(parent_args: AnnotatedArgs) -> ta.Interval | None:
+    for v in parent_args:
         if isinstance(v, ta.Interval):
             return v
         if isinstance(v, pyd.fields.FieldInfo):
@@ -546,8 +674,8 @@ def get_click_range_type(
 
 
 def is_namedtuple(hint: t.Any) -> bool:
-    if hint is None:
-        return False
-    if not inspect.isclass(hint):
-        return False
-    return issubclass(hint, tuple) and hasattr(hint, "_fields")
+    return (
+        isinstance(hint, type)
+        and issubclass(hint, tuple)
+        and hasattr(hint, "_fields")
+    )
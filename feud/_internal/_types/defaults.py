@@ -8,14 +8,32 @@ import enum
 import typing as t
 
 
+def convert_collection(default: t.Collection[t.Any]) -> t.Any:
+    return type(default)(map(convert_default, default))  # type: ignore[call-arg]
+
+
+# types of defaults that are never converted
+PASSTHROUGH_TYPES: frozenset[type] = frozenset(
+    {str, int, float, bool, bytes, type(None)}
+)
+
+# default value converters (key: type, matched along the MRO of the default)
+CONVERTERS: dict[type, t.Callable[[t.Any], t.Any]] = {
+    # this would be caught by datetime.date otherwise
+    datetime.datetime: lambda default: default,
+    datetime.date: str,
+    datetime.time: str,
+    **dict.fromkeys((set, frozenset, tuple, list), convert_collection),
+}
+
+
 def convert_default(default: t.Any) -> t.Any:
+    if type(default) in PASSTHROUGH_TYPES:
+        return default
+    # enums take precedence over any mixed-in type
     if isinstance(default, enum.Enum):
         return convert_default(default.value)
-    if isinstance(default, datetime.datetime):
-        # this would be caught by isinstance(default, datetime.date) otherwise
-        return default
-    if isinstance(default, (datetime.date, datetime.time)):
-        return str(default)
-    if isinstance(default, (set, frozenset, tuple, list)):
-        return type(default)(map(convert_default, default))
+    for base in type(default).__mro__:
+        if converter := CONVERTERS.get(base):
+            return converter(default)
     return default
@@ -9,7 +9,6 @@ groups using :py:class:`.Group`.
 
 from __future__ import annotations
 
-import inspect
 import typing as t
 
 import pydantic as pyd
@@ -52,11 +51,8 @@ class Config(pyd.BaseModel):
     rich_click_kwargs: dict[str, t.Any] = {"show_arguments": True}
 
     def __init__(self, **kwargs: t.Any) -> None:
-        caller: str | None = None
-        frame = inspect.currentframe()
-        if frame and frame.f_back:
-            caller = frame.f_back.f_code.co_name
-        if caller != Config._create.__name__:
+        # only Config._create may instantiate a configuration
+        if not kwargs.pop("_allow_direct", False):
             msg = (
                 "The feud.Config class should not be instantiated directly, "
                 "the feud.config function should be used instead."
@@ -66,12 +62,20 @@ class Config(pyd.BaseModel):
 
     @classmethod
     def _create(cls, base: Config | None = None, **kwargs: t.Any) -> Config:
-        config_kwargs = base.model_dump(exclude_unset=True) if base else {}
+        overrides: dict[str, t.Any] = {}
         for field in cls.model_fields:
             value: t.Any | None = kwargs.get(field)
             if value is not None:
-                config_kwargs[field] = value
-        return cls(**config_kwargs)
+                overrides[field] = value
+        if base is None:
+            return cls(**overrides, _allow_direct=True)
+        update: dict[str, t.Any] = {}
+        if overrides:
+            # only the overrides are validated, the base is already valid
+            config = cls(**overrides, _allow_direct=True)
+            update = {field: getattr(config, field) for field in overrides}
+        # deep copy so that dict fields are not shared with the base
+        return base.model_copy(update=update, deep=True)
 
 
 def config(
@@ -7,12 +7,15 @@
 
 from __future__ import annotations
 
+import collections.abc
 import inspect
 import sys
 import types
 import typing as t
 import warnings
 
+from click.utils import _detect_program_name
+
 import feud.exceptions
 from feud import click
 from feud._internal import _sections
@@ -20,7 +23,7 @@ from feud.config import Config
 from feud.core.command import *
 from feud.core.group import *
 
-__all__ = ["Group", "Section", "build", "command", "run"]
+__all__ = ["Group", "Section", "build", "clear_cache", "command", "run"]
 
 Runner = t.Union[
     click.Command,
@@ -76,6 +79,9 @@ def run(
         Command-line arguments provided to
         :py:class:`click.Command`.
 
+        If omitted and ``obj`` is a :py:obj:`list` or :py:obj:`tuple` of
+        strings, ``obj`` is used as the arguments for automatic discovery.
+
     name:
         CLI command or group name.
 
@@ -188,39 +194,42 @@ def run(
     >>> feud.run()  # doctest: +SKIP
     """
     # swap 'obj' and 'args' if empty 'args'
+    # (only lists/tuples, so other iterables such as generators are not
+    # consumed by the check)
     if (
         args is None
-        and isinstance(obj, t.Iterable)
-        and not isinstance(obj, dict)
+        and type(obj) in (list, tuple)
         and all(isinstance(item, str) for item in obj)  # type: ignore[union-attr]
     ):
         args = obj  # type: ignore[assignment]
         obj = None
 
-    # retrieve program name
-    prog_name: str | None = click_kwargs.get("prog_name")
-    if prog_name is None:
-        from click.utils import _detect_program_name
-
-        prog_name = _detect_program_name()
-
     # get runner
-    runner: click.Command | click.Group = build(  # type: ignore[assignment]
+    # (groups are compiled separately, to reuse previous compilations)
+    runner: click.Command | type[Group] = build(
         obj,
         name=name,
         help=help,
         epilog=epilog,
         config=config,
         warn=warn,
+        compile=False,
+    )
+    command: click.Command = (
+        compile_group(runner) if isinstance(runner, type) else runner
     )
 
     # add command and option sections
     if click.is_rich:
-        _sections.add_option_sections(runner, context=[prog_name])
-        if isinstance(runner, click.Group):
-            _sections.add_command_sections(runner, context=[prog_name])
+        # retrieve program name
+        prog_name: str | None = click_kwargs.get("prog_name")
+        if prog_name is None:
+            prog_name = _detect_program_name()
+        _sections.add_option_sections(command, context=[prog_name])
+        if isinstance(command, click.Group):
+            _sections.add_command_sections(command, context=[prog_name])
 
-    return runner(args, **click_kwargs)
+    return command(args, **click_kwargs)
 
 
 def get_runner(
@@ -237,19 +246,22 @@ def get_runner(
     """Generate a :py:class:`click.Command` or :py:class:`.Group` from any
     runnable object.
     """
-    provided_kwargs: list[str] = [
-        k
-        for k, v in {
-            "name": name,
-            "help": help,
-            "epilog": epilog,
-            "config": config,
-        }.items()
-        if v is not None
-    ]
+    # names of provided keyword arguments (only needed for warnings)
+    provided_kwargs: list[str] = []
+    if warn:
+        provided_kwargs = [
+            k
+            for k, v in (
+                ("name", name),
+                ("help", help),
+                ("epilog", epilog),
+                ("config", config),
+            )
+            if v is not None
+        ]
 
     if inspect.isclass(obj) and issubclass(obj, Group):
-        if warn and provided_kwargs:
+        if provided_kwargs:
             msg = (
                 f"The keyword arguments {provided_kwargs!r} provided to "
                 f"feud.run will be ignored.\nConsider redefining the "
@@ -261,7 +273,7 @@ def get_runner(
             warnings.warn(msg, stacklevel=1)
         return obj
     if isinstance(obj, click.Group):
-        if warn and provided_kwargs:
+        if provided_kwargs:
             msg = (
                 f"The keyword arguments {provided_kwargs!r} provided to "
                 f"feud.run will be ignored.\nConsider providing these "
@@ -270,7 +282,7 @@ def get_runner(
             warnings.warn(msg, stacklevel=1)
         return obj
     if isinstance(obj, click.Command):
-        if warn and provided_kwargs:
+        if provided_kwargs:
             msg = (
                 f"The keyword arguments {provided_kwargs!r} provided to "
                 f"feud.run will be ignored.\nConsider redefining the "
@@ -285,7 +297,9 @@ def get_runner(
         items: dict[str, click.Command | type[Group]] = {}
         for k, v in obj.items():
             kwargs: dict[str, t.Any] = {"name": k}
-            if isinstance(v, (dict, t.Iterable, types.ModuleType)):
+            if isinstance(
+                v, (dict, collections.abc.Iterable, types.ModuleType)
+            ):
                 kwargs["config"] = config
             # set convert_func=False to leave @feud.command to group metaclass
             items[k] = get_runner(v, convert_func=False, warn=False, **kwargs)
@@ -296,10 +310,10 @@ def get_runner(
             epilog=epilog,
             config=config,
         )
-    if isinstance(obj, t.Iterable):
+    if isinstance(obj, collections.abc.Iterable):
         items: list[click.Command | type[Group]] = []  # type: ignore[no-redef]
         for v in obj:  # type: ignore[union-attr]
-            if isinstance(v, (dict, t.Iterable)):
+            if isinstance(v, (dict, collections.abc.Iterable)):
                 msg = (
                     "Groups cannot be constructed from dict or iterable "
                     "objects nested within iterable objects."
@@ -348,7 +362,7 @@ def build(
     config: Config | None = None,
     warn: bool = True,
     compile: bool = True,  # noqa: A002
-) -> click.Command | click.Group | Group:
+) -> click.Command | click.Group | type[Group]:
     """Build a :py:class:`click.Command` or :py:class:`click.Group` from
     a runnable object.
 
@@ -392,9 +406,13 @@ def build(
         Whether or not to compile :py:class:`.Group` objects into
         :py:class:`click.Group` objects.
 
+        A new :py:class:`click.Group` is compiled on each call, so the
+        returned group may be modified without affecting other calls.
+        Only :py:func:`.run` reuses previously compiled groups.
+
     Returns
     -------
-    click.Command | click.Group | Group
+    click.Command | click.Group | type[Group]
         The runnable object.
 
     Raises
@@ -414,10 +432,23 @@ def build(
     >>> isinstance(group, click.Group)
     True
     """
+    # fast path for a group with no (ignored) overrides
+    if (
+        inspect.isclass(obj)
+        and issubclass(obj, Group)
+        and name is None
+        and help is None
+        and epilog is None
+        and config is None
+    ):
+        return obj.compile() if compile else obj
+
     # use current module if no runner provided
     if obj is None:
-        frame = inspect.stack()[1]
-        obj = sys.modules.get("__main__", inspect.getmodule(frame[0]))
+        obj = sys.modules.get("__main__")
+        if obj is None:
+            # only inspect the calling frame if there is no __main__ module
+            obj = inspect.getmodule(sys._getframe(1))  # noqa: SLF001
 
     if obj is None:
         msg = (
@@ -426,7 +457,7 @@ def build(
         )
         raise feud.CompilationError(msg)
 
-    runner: click.Command | Group = get_runner(  # type: ignore[assignment]
+    runner: click.Command | type[Group] = get_runner(
         obj,
         name=name,
         help=help,
@@ -439,3 +470,59 @@ def build(
         return runner.compile()
 
     return runner
+
+
+def compile_group(group: type[Group], /) -> click.Group:
+    """Compile a :py:class:`.Group`, reusing its previous compilation if
+    neither the group nor any of its subgroups have since changed.
+    """
+    state: list[tuple[t.Any, ...]] = list(get_state(group))
+    cached: tuple[list[tuple[t.Any, ...]], click.Group] | None = (
+        group.__dict__.get("__feud_compiled__")
+    )
+    if cached and cached[0] == state:
+        return cached[1]
+    click_group: click.Group = group.compile()
+    group.__feud_compiled__ = (state, click_group)  # type: ignore[attr-defined]
+    return click_group
+
+
+def get_state(group: type[Group], /) -> t.Iterator[tuple[t.Any, ...]]:
+    """Attributes that a compiled group depends on, for the group and each of
+    its descendant subgroups.
+    """
+    yield (
+        group,
+        group.__feud_config__,
+        dict(group.__feud_click_kwargs__),
+        group.commands(),
+        group.subgroups(),
+    )
+    for subgroup in group.__feud_subgroups__:
+        yield from get_state(subgroup)
+
+
+def clear_cache() -> None:
+    """Clear :py:class:`click.Group` objects cached by :py:func:`.run` when
+    compiling :py:class:`.Group` objects.
+
+    Groups are automatically recompiled if their commands, subgroups or
+    configuration are replaced (e.g. with :py:meth:`.Group.register`), so
+    this is only needed if these are modified in-place.
+
+    Examples
+    --------
+    >>> import feud
+    >>> class CLI(feud.Group):
+    ...     def func(*, opt: int) -> int:
+    ...         return opt
+    >>> feud.run(CLI, ["func", "--opt", "1"], standalone_mode=False)
+    1
+    >>> feud.clear_cache()
+    """
+    groups: list[type[Group]] = Group.__subclasses__()
+    while groups:
+        group: type[Group] = groups.pop()
+        if "__feud_compiled__" in group.__dict__:
+            del group.__feud_compiled__  # type: ignore[attr-defined]
+        groups.extend(group.__subclasses__())
@@ -9,10 +9,25 @@ Note that other arbitrary types may work with Feud,
 but those imported within this module are the officially supported types.
 """
 
+from feud.typing import pydantic_extra_types
 from feud.typing.custom import *
 from feud.typing.pydantic import *
-from feud.typing.pydantic_extra_types import *
 from feud.typing.stdlib import *
 from feud.typing.typing import *
 
 __all__ = [name for name in dir() if not name.startswith("__")]
+
+# pydantic-extra-types types are imported on first access
+__all__.extend(pydantic_extra_types.__all__)
+
+
+def __getattr__(name: str) -> object:
+    if name in pydantic_extra_types.__all__:
+        value = globals()[name] = getattr(pydantic_extra_types, name)
+        return value
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
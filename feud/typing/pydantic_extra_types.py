@@ -9,86 +9,84 @@ from __future__ import annotations
 
 __all__: list[str] = []
 
-from operator import attrgetter
+import importlib
+import importlib.metadata
+import typing as t
 
 import packaging.version
 
+#: Import paths of types relative to ``pydantic_extra_types``, by name.
+#:
+#: Types are only imported when first accessed, as importing
+#: ``pydantic_extra_types`` modules is comparatively slow.
+_types: dict[str, str] = {}
+
 
 def split(string: str) -> str:
     return string.split(".")[-1]
 
 
 try:
-    import pydantic_extra_types
-
+    # read from package metadata to avoid importing pydantic_extra_types
     version: packaging.version.Version = packaging.version.parse(
-        pydantic_extra_types.__version__,
+        importlib.metadata.version("pydantic-extra-types"),
     )
 
-    if version >= packaging.version.parse("2.1.0"):
-        import pydantic_extra_types.color
-        import pydantic_extra_types.coordinate
-        import pydantic_extra_types.country
-        import pydantic_extra_types.mac_address
-        import pydantic_extra_types.payment
-        import pydantic_extra_types.phone_numbers
-        import pydantic_extra_types.routing_number
-
-        types: list[str] = [
-            "color.Color",
-            "coordinate.Coordinate",
-            "coordinate.Latitude",
-            "coordinate.Longitude",
-            "country.CountryAlpha2",
-            "country.CountryAlpha3",
-            "country.CountryNumericCode",
-            "country.CountryShortName",
-            "mac_address.MacAddress",
-            "payment.PaymentCardBrand",
-            "payment.PaymentCardNumber",
-            "phone_numbers.PhoneNumber",
-            "routing_number.ABARoutingNumber",
-        ]
+    paths: list[str] = []
 
-        if version < packaging.version.parse("2.4.0"):
-            types.append("country.CountryOfficialName")
-
-        globals().update(
-            {
-                split(attr): attrgetter(attr)(pydantic_extra_types)
-                for attr in types
-            }
+    if version >= packaging.version.parse("2.1.0"):
+        paths.extend(
+            [
+                "color.Color",
+                "coordinate.Coordinate",
+                "coordinate.Latitude",
+                "coordinate.Longitude",
+                "country.CountryAlpha2",
+                "country.CountryAlpha3",
+                "country.CountryNumericCode",
+                "country.CountryShortName",
+                "mac_address.MacAddress",
+                "payment.PaymentCardBrand",
+                "payment.PaymentCardNumber",
+                "phone_numbers.PhoneNumber",
+                "routing_number.ABARoutingNumber",
+            ]
         )
 
-        __all__.extend(map(split, types))
+        if version < packaging.version.parse("2.4.0"):
+            paths.append("country.CountryOfficialName")
 
     if version >= packaging.version.parse("2.2.0"):
-        from pydantic_extra_types.ulid import ULID
-
-        __all__.append("ULID")
+        paths.append("ulid.ULID")
 
     if version >= packaging.version.parse("2.4.0"):
-        from pydantic_extra_types.isbn import ISBN
-
-        __all__.append("ISBN")
+        paths.append("isbn.ISBN")
 
     if version >= packaging.version.parse("2.7.0"):
-        from pydantic_extra_types.language_code import (
-            LanguageAlpha2,
-            LanguageName,
+        paths.extend(
+            ["language_code.LanguageAlpha2", "language_code.LanguageName"]
         )
 
-        __all__.extend(["LanguageAlpha2", "LanguageName"])
-
     if version >= packaging.version.parse("2.9.0"):
-        from pydantic_extra_types.semantic_version import SemanticVersion
-
-        __all__.append("SemanticVersion")
+        paths.append("semantic_version.SemanticVersion")
 
     if version >= packaging.version.parse("2.10.0"):
-        from pydantic_extra_types.s3 import S3Path
+        paths.append("s3.S3Path")
 
-        __all__.append("S3Path")
+    _types.update({split(path): path for path in paths})
+    __all__.extend(_types)
 
-except ImportError:
+except importlib.metadata.PackageNotFoundError:
     pass
+
+
+def __getattr__(name: str) -> t.Any:
+    if path := _types.get(name):
+        module, _, attr = path.rpartition(".")
+        value = getattr(
+            importlib.import_module(f"pydantic_extra_types.{module}"), attr
+        )
+        globals()[name] = value
+        return value
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
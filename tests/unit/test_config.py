@@ -56,6 +56,14 @@ def test_create_no_base_with_kwargs_non_default() -> None:
     assert config.show_help_defaults is False
 
 
+def test_create_base_copy() -> None:
+    """Dict fields are not shared with the base configuration."""
+    base = Config._create()  # noqa: SLF001
+    config = Config._create(base=base, negate_flags=False)  # noqa: SLF001
+    assert config.pydantic_kwargs is not base.pydantic_kwargs
+    assert config.rich_click_kwargs is not base.rich_click_kwargs
+
+
 def test_create_base_with_no_base_kwargs_no_override_kwargs() -> None:
     """Base configuration with no base keyword arguments set
     and no override keyword arguments set.
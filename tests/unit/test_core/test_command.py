@@ -144,6 +144,23 @@ def test_kwarg_call() -> None:
     assert isinstance(f, click.Command)
 
 
+def test_name_none() -> None:
+    @feud.command(name=None)
+    def my_func(*, opt: int) -> None:
+        pass
+
+    assert my_func.name == "my-func"
+
+
+def test_click_params_removed() -> None:
+    @feud.command
+    @click.option("--opt", type=int, default=1)
+    def f(*, opt: int = 1) -> None:
+        pass
+
+    assert not hasattr(f.callback, "__click_params__")
+
+
 def test_config_propagation() -> None:
     """Check that configuration options propagate to command parameters.
 
@@ -721,3 +721,56 @@ def test_get_runner_dict_iterable(*, override: bool) -> None:
     assert command.name == "command"
     assert command.help == _docstring.get_description(command)
     assert command.epilog is None
+
+
+def test_build_group_fresh() -> None:
+    class Test(feud.Group):
+        def func(*, opt: int) -> int:
+            return opt
+
+    # build compiles a new group on each call
+    assert feud.build(Test) is not feud.build(Test)
+
+
+def test_compile_group_cache() -> None:
+    class Test(feud.Group):
+        def func(*, opt: int) -> int:
+            return opt
+
+    class Sub(feud.Group):
+        def sub_func(*, opt: int) -> int:
+            return opt
+
+    class Other(feud.Group):
+        def other_func(*, opt: int) -> int:
+            return opt
+
+    # compiled group is reused while unmodified
+    group: click.Group = feud.core.compile_group(Test)
+    assert feud.core.compile_group(Test) is group
+    assert list(group.commands) == ["func"]
+
+    # modifying an unrelated group does not recompile the group
+    Other.register(Sub)
+    assert feud.core.compile_group(Test) is group
+
+    # registering a subgroup recompiles the group
+    Test.register(Sub)
+    group = feud.core.compile_group(Test)
+    assert feud.core.compile_group(Test) is group
+    assert list(group.commands) == ["func", "sub"]
+
+    # modifying a subgroup recompiles the group
+    Sub.add_commands([Test.func])
+    group = feud.core.compile_group(Test)
+    assert feud.core.compile_group(Test) is group
+    assert list(group.commands["sub"].commands) == ["sub_func", "func"]
+
+    # deregistering a subgroup recompiles the group
+    Test.deregister(Sub)
+    group = feud.core.compile_group(Test)
+    assert list(group.commands) == ["func"]
+
+    # clearing the cache recompiles the group
+    feud.clear_cache()
+    assert feud.core.compile_group(Test) is not group
@@ -14,6 +14,29 @@ from feud import typing as t
 from feud._internal import _command
 
 
+def test_get_signature() -> None:
+    def f(a: int, *, b: str) -> None:
+        pass
+
+    sig = _command.get_signature(f)
+    assert sig.parameters["b"].annotation is str
+    assert _command.get_signature(f) is sig
+
+
+def test_get_overrides() -> None:
+    @click.option("--a")
+    def f(*, a: str) -> None:
+        pass
+
+    overrides = _command.get_overrides(f)
+    assert list(overrides) == ["a"]
+    assert _command.get_overrides(f) is overrides
+
+    # declaring further click parameters invalidates the stored mapping
+    f = click.option("--b")(f)
+    assert list(_command.get_overrides(f)) == ["a", "b"]
+
+
 def test_get_context_ctx_no_annotation() -> None:
     def f(ctx, a: t.Any, b: t.Any, c: t.Any) -> None:  # noqa: ANN001
         pass
@@ -205,3 +205,37 @@ def test_validate_call_datetime() -> None:
   Input should be in the future
 """.strip()
     )
+
+
+def test_validate_call_repeated() -> None:
+    """Check that a function wrapped by ``validate_call`` can be called
+    repeatedly with valid and invalid input values.
+    """
+    name = "func"
+    param_renames = {"arg2": "arg-2"}
+    meta_vars = {"arg-2": "--arg-2"}
+    sensitive_vars = {"arg-2": False}
+    positional = []
+    var_positional = None
+    pydantic_kwargs = {}
+
+    def f(*, arg2: int) -> int:
+        return arg2
+
+    wrapper = _decorators.validate_call(
+        f,
+        name=name,
+        param_renames=param_renames,
+        meta_vars=meta_vars,
+        sensitive_vars=sensitive_vars,
+        positional=positional,
+        var_positional=var_positional,
+        pydantic_kwargs=pydantic_kwargs,
+    )
+
+    assert wrapper(**{"arg-2": "1"}) == 1
+
+    with pytest.raises(click.UsageError):
+        wrapper(**{"arg-2": "invalid"})
+
+    assert wrapper(**{"arg-2": "2"}) == 2
@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: MIT
 # This source code is part of the Feud project (https://feud.wiki).
 
+import dataclasses
 import enum
 
 import pytest
@@ -275,3 +276,32 @@ def test_get_description_class_override() -> None:
         """
 
     assert Group.compile().help == "Override."
+
+
+def test_parse_from_object_cached() -> None:
+    def f() -> None:
+        """Line 1."""
+
+    def g() -> None:
+        """Line 1."""
+
+    doc = _docstring.parse_from_object(f)
+    assert doc.description == "Line 1."
+    assert _docstring.parse_from_object(g) is doc
+
+
+def test_parse_immutable() -> None:
+    doc = _docstring.parse(
+        """Line 1.
+
+        Parameters
+        ----------
+        opt:
+            Option.
+        """
+    )
+    assert doc.params == {"opt": "Option."}
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        doc.description = "Line 2."  # type: ignore[misc]
+    with pytest.raises(TypeError):
+        doc.params["opt"] = "Changed."  # type: ignore[index]
@@ -9,6 +9,7 @@ import click
 import pytest
 
 from feud import typing as t
+from feud._internal import _types
 from feud._internal._types.click import Union
 from feud.config import Config
 
@@ -30,6 +31,7 @@ def annotate(hint: t.Any) -> t.Annotated[t.Any, "annotation"]:
             t.Literal["a", "b"],
             lambda x: isinstance(x, click.Choice) and x.choices == ["a", "b"],
         ),
+        (t.Annotated[int, {"key": "value"}], click.INT),
         (t.Tuple, None),
         (t.Tuple[int], (click.INT,)),
         (t.Tuple[annotate(int)], (click.INT,)),
@@ -75,3 +77,19 @@ def test_typing(
         hint=hint,
         expected=expected,
     )
+
+
+def test_typing_argument_order(config: Config) -> None:
+    # typing equality disregards argument order for t.Literal and t.Union
+    # so cached click types should not be shared between these hints
+    get_click_type = _types.click.get_click_type
+
+    choice_ab = get_click_type(t.Literal["a", "b"], config=config)
+    choice_ba = get_click_type(t.Literal["b", "a"], config=config)
+    assert choice_ab.choices == ["a", "b"]
+    assert choice_ba.choices == ["b", "a"]
+
+    union_is = get_click_type(t.Union[int, str], config=config)
+    union_si = get_click_type(t.Union[str, int], config=config)
+    assert union_is.types == [click.INT, click.STRING]
+    assert union_si.types == [click.STRING, click.INT]